@@ -478,10 +478,13 @@ def get_calibrated_monitor(
         Position of the neutron source.
     """
     monitor = nexus.compute_component_position(monitor)
+    position = monitor['position']
+    # The default offset is zero, skip the unit conversion and addition in that case.
+    if not sc.identical(offset, no_offset):
+        position = position + offset.to(unit=position.unit)
     return CalibratedMonitor[RunType, MonitorType](
         nexus.extract_signal_data_array(monitor).assign_coords(
-            position=monitor['position'] + offset.to(unit=monitor['position'].unit),
-            source_position=source_position,
+            position=position, source_position=source_position
         )
     )
 
@@ -714,7 +717,9 @@ def _prune_type_vars(
 
     graph = workflow.underlying_graph
     to_remove = [
-        node for node in graph if excluded_types & set(getattr(node, "__args__", set()))
+        node
+        for node in graph
+        if not excluded_types.isdisjoint(getattr(node, "__args__", ()))
     ]
     graph.remove_nodes_from(to_remove)
 
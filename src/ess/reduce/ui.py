@@ -125,7 +125,7 @@ class ResultBox(widgets.VBox):
         )
 
         def run_workflow(_: widgets.Button) -> None:
-            self.output.clear_output()
+            self.output.clear_output(wait=True)
             with self.output:
                 compute_result = workflow_runner()
                 if result_registry is not None:
@@ -154,7 +154,7 @@ def param_with_option_widget(param: ParamWithOptions):
 
 @create_parameter_widget.register(ParamWithBounds)
 def param_with_bounds_widget(param: ParamWithBounds):
-    return BoundsWidget()
+    return BoundsWidget.from_ess_parameter(param)
 
 
 @create_parameter_widget.register(BinEdgesParameter)
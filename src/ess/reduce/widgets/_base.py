@@ -15,19 +15,19 @@ class WidgetWithFieldsProtocol(Protocol):
 
 class WidgetWithFieldsMixin:
     def set_fields(self, new_values: dict[str, Any]) -> None:
-        # Extract valid fields
-        new_field_names = set(new_values.keys())
-        valid_field_names = new_field_names & set(self.fields.keys())
         # Warn for invalid fields
-        invalid_field_names = new_field_names - valid_field_names
-        for field_name in invalid_field_names:
-            warning_msg = f"Cannot set field '{field_name}'."
-            " The field does not exist in the widget."
-            "The field value will be ignored."
-            warnings.warn(warning_msg, UserWarning, stacklevel=1)
+        if invalid_field_names := new_values.keys() - self.fields.keys():
+            warnings.warn(
+                f"Cannot set fields {sorted(invalid_field_names)}."
+                " The fields do not exist in the widget."
+                " The field values will be ignored.",
+                UserWarning,
+                stacklevel=1,
+            )
         # Set valid fields
-        for field_name in valid_field_names:
-            self.fields[field_name].value = new_values[field_name]
+        for field_name, value in new_values.items():
+            if field_name in self.fields:
+                self.fields[field_name].value = value
 
     def get_fields(self) -> dict[str, Any]:
         return {
@@ -43,7 +43,7 @@ class BinEdgesWidget(ipw.HBox, ipw.ValueWidget, WidgetWithFieldsMixin):
         if not isinstance(units, dict):
             units = {"options": units}
         self.fields = {
-            "dim": ipw.Label(str(dim)),
+            "dim": ipw.Label(dim),
             "unit": ipw.Dropdown(
                 options=units["options"],
                 value=units.get("selected", units["options"][0]),
@@ -25,9 +25,10 @@ class BoundsWidget(GridBox, ValueWidget, WidgetWithFieldsMixin):
 
     @property
     def value(self):
+        unit = self.fields['unit'].value
         return (
-            sc.scalar(self.fields['start'].value, unit=self.fields['unit']),
-            sc.scalar(self.fields['end'].value, unit=self.fields['unit']),
+            sc.scalar(self.fields['start'].value, unit=unit),
+            sc.scalar(self.fields['end'].value, unit=unit),
         )
 
     @staticmethod
@@ -6,6 +6,9 @@ from ipywidgets import HTML, HBox, Layout, RadioButtons, Widget
 
 from ._config import default_style
 
+_option_box_layout = Layout(width="auto", min_width="80px")
+_hidden_layout = Layout(display="none")
+
 
 class OptionalWidget(HBox):
     """Wrapper widget to handle optional widgets.
@@ -21,7 +24,7 @@ class OptionalWidget(HBox):
         self._option_box = RadioButtons(
             description="",
             style=default_style,
-            layout=Layout(width="auto", min_width="80px"),
+            layout=_option_box_layout,
             options={str(None): None, "": self.name},
         )
         self._option_box.value = None
@@ -35,7 +38,7 @@ class OptionalWidget(HBox):
         _style_html = HTML(
             "<style>.widget-optional .widget-radio-box "
             "{flex-direction: row !important;} </style>",
-            layout=Layout(display="none"),
+            layout=_hidden_layout,
         )
 
         def disable_wrapped(change) -> None:
@@ -53,7 +56,6 @@ class OptionalWidget(HBox):
     @property
     def value(self) -> Any:
         if self._option_box.value is None:
-            self._option_box.value = None
             return None
         return self.wrapped.value
 
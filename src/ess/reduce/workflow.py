@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 from __future__ import annotations
 
-from collections.abc import Callable, MutableSet, Sequence
+from collections.abc import Callable, Iterable, MutableSet, Sequence
 from typing import Any, TypeVar
 
 import networkx as nx
@@ -20,7 +20,8 @@ class WorkflowRegistry(MutableSet):
         self._workflows: dict[str, type] = {}
 
     def __contains__(self, item: object) -> bool:
-        return item in self._workflows.values()
+        key = getattr(item, '__qualname__', None)
+        return key in self._workflows and self._workflows[key] == item
 
     def __iter__(self):
         return iter(self._workflows.values())
@@ -33,7 +34,8 @@ class WorkflowRegistry(MutableSet):
         self._workflows[key] = value
 
     def discard(self, value: type) -> None:
-        self._workflows = {k: v for k, v in self._workflows.items() if v != value}
+        if value in self:
+            del self._workflows[value.__qualname__]
 
 
 workflow_registry = WorkflowRegistry()
@@ -44,11 +46,6 @@ def register_workflow(cls: Callable[[], Pipeline]) -> Callable[[], Pipeline]:
     return cls
 
 
-def _get_defaults_from_workflow(workflow: Pipeline) -> dict[Key, Any]:
-    nodes = workflow.underlying_graph.nodes
-    return {key: values["value"] for key, values in nodes.items() if "value" in values}
-
-
 def get_typical_outputs(pipeline: Pipeline) -> tuple[Key, ...]:
     if (typical_outputs := getattr(pipeline, "typical_outputs", None)) is None:
         graph = pipeline.underlying_graph
@@ -58,25 +55,38 @@ def get_typical_outputs(pipeline: Pipeline) -> tuple[Key, ...]:
 
 
 def get_possible_outputs(pipeline: Pipeline) -> tuple[Key, ...]:
-    return sorted(_with_pretty_names(tuple(pipeline.underlying_graph.nodes)))
+    return sorted(_with_pretty_names(pipeline.underlying_graph.nodes))
 
 
-def _with_pretty_names(outputs: Sequence[Key]) -> tuple[tuple[str, Key], ...]:
+def _with_pretty_names(outputs: Iterable[Key]) -> tuple[tuple[str, Key], ...]:
     """Add a more readable string representation without full module path."""
     return tuple((key_name(output), output) for output in outputs)
 
 
+def _with_ancestors(graph: nx.DiGraph, keys: Sequence[Key]) -> set[Key]:
+    """Return ``keys`` and all their ancestors in ``graph``.
+
+    Equivalent to the union of ``nx.ancestors`` of each key, but shared ancestors
+    are visited only once.
+    """
+    found = set(keys)
+    stack = list(found)
+    while stack:
+        for parent in graph.predecessors(stack.pop()):
+            if parent not in found:
+                found.add(parent)
+                stack.append(parent)
+    return found
+
+
 def get_parameters(
     pipeline: Pipeline, outputs: tuple[Key, ...]
 ) -> dict[Key, Parameter]:
     """Return a dictionary of parameters for the workflow."""
-    subgraph = set(outputs)
     graph = pipeline.underlying_graph
-    for key in outputs:
-        subgraph.update(nx.ancestors(graph, key))
-    defaults = _get_defaults_from_workflow(pipeline)
+    subgraph = _with_ancestors(graph, outputs)
     return {
-        key: param.with_default(defaults.get(key, keep_default))
+        key: param.with_default(graph.nodes[key].get("value", keep_default))
         for key, param in parameter_registry.items()
         if key in subgraph
     }
@@ -189,23 +189,30 @@ def _write_nexus_data(store: Path | BytesIO) -> None:
 
 
 @contextmanager
-def _file_store(request: pytest.FixtureRequest):
+def _file_store(request: pytest.FixtureRequest, content: bytes):
     if request.param == BytesIO:
-        yield BytesIO()
+        yield BytesIO(content)
     else:
         # It would be good to use pyfakefs here, but h5py
         # uses C to open files and that bypasses the fake.
         base = request.getfixturevalue('tmp_path')
-        yield base / 'testfile.nxs'
+        path = base / 'testfile.nxs'
+        path.write_bytes(content)
+        yield path
 
 
-@pytest.fixture(params=[Path, BytesIO, snx.Group])
-def nexus_file(request):
-    with _file_store(request) as store:
-        _write_nexus_data(store)
-        if isinstance(store, BytesIO):
-            store.seek(0)
+@pytest.fixture(scope='module')
+def nexus_file_content() -> bytes:
+    # Some tests modify the file, so only the serialized content is shared
+    # and every test gets a fresh copy of it.
+    store = BytesIO()
+    _write_nexus_data(store)
+    return store.getvalue()
+
 
+@pytest.fixture(params=[Path, BytesIO, snx.Group])
+def nexus_file(request, nexus_file_content):
+    with _file_store(request, nexus_file_content) as store:
         if request.param in (Path, BytesIO):
             yield store
         else:
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Scipp contributors (https://github.com/scipp)
+from collections.abc import Generator
+
 import pytest
 import scipp as sc
 import scippnexus as snx
@@ -20,6 +22,7 @@ from ess.reduce.nexus.types import (
     MonitorData,
     MonitorType,
     NeXusComponentLocationSpec,
+    NeXusFileSpec,
     NeXusName,
     NeXusTransformation,
     RunType,
@@ -34,12 +37,7 @@ from ess.reduce.nexus.workflow import (
 )
 
 
-@pytest.fixture(params=[{}, {'aux': 1}])
-def group_with_no_position(request) -> workflow.NeXusComponent[snx.NXsample, SampleRun]:
-    return workflow.NeXusComponent[snx.NXsample, SampleRun](sc.DataGroup(request.param))
-
-
-@pytest.fixture
+@pytest.fixture(scope='module')
 def depends_on() -> snx.TransformationChain:
     translation = snx.nxtransformations.Transform(
         name='/entry/instrument/comp1/transformations/trans1',
@@ -87,7 +85,7 @@ def time_dependent_depends_on() -> snx.TransformationChain:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def transform(
     depends_on: snx.TransformationChain,
 ) -> NeXusTransformation[snx.NXdetector, SampleRun]:
@@ -172,13 +170,20 @@ def test_to_transform_raises_if_interval_does_not_yield_unique_value(
         )
 
 
-def test_given_no_sample_load_nexus_sample_returns_group_with_origin_depends_on() -> (
-    None
-):
+@pytest.fixture(scope='module')
+def loki_sample_filespec() -> Generator[NeXusFileSpec[SampleRun], None, None]:
+    # Opening the file is the dominant cost of the tests using it, share the open file.
     filespec = workflow.file_path_to_file_spec(
         data.loki_tutorial_sample_run_60250(), preopen=True
     )
-    spec = workflow.unique_component_spec(filespec)
+    yield filespec
+    filespec.value.close()
+
+
+def test_given_no_sample_load_nexus_sample_returns_group_with_origin_depends_on(
+    loki_sample_filespec,
+) -> None:
+    spec = workflow.unique_component_spec(loki_sample_filespec)
     assert spec.filename['/entry'][snx.NXsample] == {}
     sample = workflow.load_nexus_sample(spec)
     assert list(sample) == ['depends_on']
@@ -191,14 +196,16 @@ def test_given_no_sample_load_nexus_sample_returns_group_with_origin_depends_on(
     assert_identical(position, sc.vector([0.0, 0.0, 0.0], unit='m'))
 
 
+@pytest.mark.parametrize('content', [{}, {'aux': 1}], ids=['empty', 'aux'])
 def test_get_transformation_chain_raises_exception_if_position_not_found(
-    group_with_no_position,
+    content,
 ) -> None:
+    group = workflow.NeXusComponent[snx.NXsample, SampleRun](sc.DataGroup(content))
     with pytest.raises(KeyError, match='depends_on'):
-        workflow.get_transformation_chain(group_with_no_position)
+        workflow.get_transformation_chain(group)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def nexus_detector(
     depends_on: snx.TransformationChain,
 ) -> workflow.NeXusComponent[snx.NXdetector, SampleRun]:
@@ -246,6 +253,7 @@ def test_get_calibrated_detector_folds_detector_number_if_mapping_given(
 def test_get_calibrated_detector_works_if_nexus_component_name_is_missing(
     nexus_detector, transform
 ):
+    nexus_detector = nexus_detector.copy()
     del nexus_detector['nexus_component_name']
     detector = workflow.get_calibrated_detector(
         nexus_detector,
@@ -299,6 +307,7 @@ def test_get_calibrated_detector_position_unit_matches_offset_unit(
     nexus_detector, transform_value
 ) -> None:
     transform = NeXusTransformation(transform_value)
+    nexus_detector = nexus_detector.copy()
     nexus_detector['data'].coords['x_pixel_offset'] = (
         nexus_detector['data'].coords['x_pixel_offset'].to(unit='mm')
     )
@@ -310,6 +319,7 @@ def test_get_calibrated_detector_position_unit_matches_offset_unit(
 
 
 def test_get_calibrated_detector_forwards_coords(nexus_detector, transform) -> None:
+    nexus_detector = nexus_detector.copy()
     nexus_detector['data'].coords['abc'] = sc.scalar(1.2)
     detector = workflow.get_calibrated_detector(
         nexus_detector, offset=workflow.no_offset, bank_sizes={}, transform=transform
@@ -321,6 +331,7 @@ def test_get_calibrated_detector_forwards_masks(
     nexus_detector,
     transform,
 ) -> None:
+    nexus_detector = nexus_detector.copy()
     nexus_detector['data'].masks['mymask'] = sc.scalar(False)
     detector = workflow.get_calibrated_detector(
         nexus_detector, offset=workflow.no_offset, bank_sizes={}, transform=transform
@@ -328,7 +339,7 @@ def test_get_calibrated_detector_forwards_masks(
     assert 'mymask' in detector.masks
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def calibrated_detector() -> workflow.CalibratedDetector[SampleRun]:
     detector_number = sc.arange('detector_number', 6, unit=None)
     return workflow.CalibratedDetector[SampleRun](
@@ -342,11 +353,11 @@ def calibrated_detector() -> workflow.CalibratedDetector[SampleRun]:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def detector_event_data() -> workflow.NeXusData[snx.NXdetector, SampleRun]:
     content = sc.DataArray(
-        sc.ones(dims=['event'], shape=[17], unit='counts'),
-        coords={'event_id': sc.arange('event', 17, unit=None) % sc.index(6)},
+        sc.ones(dims=['event'], shape=[11], unit='counts'),
+        coords={'event_id': sc.arange('event', 11, unit=None) % sc.index(6)},
     )
     weights = sc.bins(data=content, dim='event')
     return workflow.NeXusData[snx.NXdetector, SampleRun](
@@ -370,10 +381,10 @@ def test_assemble_detector_data_groups_events_by_detector_number(
         detector.coords['detector_number'],
         calibrated_detector.coords['detector_number'],
     )
-    # 17 events with arange%6 event_id, so 2 events in last bin
+    # 11 events with arange%6 event_id, so 1 event in last bin
     assert_identical(
         detector.data.bins.size(),
-        sc.array(dims=('xpixel', 'ypixel'), values=[[3, 3, 3], [3, 3, 2]], unit=None),
+        sc.array(dims=('xpixel', 'ypixel'), values=[[2, 2, 2], [2, 2, 1]], unit=None),
     )
 
 
@@ -394,12 +405,14 @@ def test_assemble_detector_data_adds_variances_to_weights(
 
 
 def test_assemble_detector_preserves_coords(calibrated_detector, detector_event_data):
+    calibrated_detector = calibrated_detector.copy()
     calibrated_detector.coords['abc'] = sc.scalar(1.2)
     detector = workflow.assemble_detector_data(calibrated_detector, detector_event_data)
     assert 'abc' in detector.coords
 
 
 def test_assemble_detector_preserves_masks(calibrated_detector, detector_event_data):
+    calibrated_detector = calibrated_detector.copy()
     calibrated_detector.masks['mymask'] = sc.scalar(False)
     detector = workflow.assemble_detector_data(calibrated_detector, detector_event_data)
     assert 'mymask' in detector.masks
@@ -429,6 +442,17 @@ def test_get_calibrated_monitor_extracts_data_field_from_nexus_monitor(
     )
 
 
+def test_get_calibrated_monitor_without_offset_keeps_position(
+    nexus_monitor,
+) -> None:
+    monitor = workflow.get_calibrated_monitor(
+        nexus_monitor,
+        offset=workflow.no_monitor_position_offset(),
+        source_position=sc.vector([0.0, 0.0, -10.0], unit='m'),
+    )
+    assert_identical(monitor.coords['position'], sc.vector([1.0, 2.0, 3.0], unit='m'))
+
+
 def test_get_calibrated_monitor_subtracts_offset_from_position(
     nexus_monitor,
 ) -> None:
@@ -453,7 +477,7 @@ def calibrated_monitor() -> workflow.CalibratedMonitor[SampleRun, Monitor1]:
 
 @pytest.fixture
 def monitor_event_data() -> workflow.NeXusData[Monitor1, SampleRun]:
-    content = sc.DataArray(sc.ones(dims=['event'], shape=[17], unit='counts'))
+    content = sc.DataArray(sc.ones(dims=['event'], shape=[5], unit='counts'))
     weights = sc.bins(data=content, dim='event')
     return workflow.NeXusData[Monitor1, SampleRun](
         sc.DataArray(
@@ -506,9 +530,9 @@ def test_assemble_monitor_preserves_masks(calibrated_monitor, monitor_event_data
     assert 'mymask' in monitor_data.masks
 
 
-def test_load_monitor_workflow() -> None:
+def test_load_monitor_workflow(loki_sample_filespec) -> None:
     wf = LoadMonitorWorkflow()
-    wf[Filename[SampleRun]] = data.loki_tutorial_sample_run_60250()
+    wf[NeXusFileSpec[SampleRun]] = loki_sample_filespec
     wf[NeXusName[Monitor1]] = 'monitor_1'
     da = wf.compute(MonitorData[SampleRun, Monitor1])
     assert 'position' in da.coords
@@ -517,9 +541,9 @@ def test_load_monitor_workflow() -> None:
     assert da.dims == ('event_time_zero',)
 
 
-def test_load_detector_workflow() -> None:
+def test_load_detector_workflow(loki_sample_filespec) -> None:
     wf = LoadDetectorWorkflow()
-    wf[Filename[SampleRun]] = data.loki_tutorial_sample_run_60250()
+    wf[NeXusFileSpec[SampleRun]] = loki_sample_filespec
     wf[NeXusName[snx.NXdetector]] = 'larmor_detector'
     da = wf.compute(DetectorData[SampleRun])
     assert 'position' in da.coords
@@ -529,9 +553,9 @@ def test_load_detector_workflow() -> None:
     assert da.dims == ('detector_number',)
 
 
-def test_generic_nexus_workflow() -> None:
+def test_generic_nexus_workflow(loki_sample_filespec) -> None:
     wf = GenericNeXusWorkflow()
-    wf[Filename[SampleRun]] = data.loki_tutorial_sample_run_60250()
+    wf[NeXusFileSpec[SampleRun]] = loki_sample_filespec
     wf[NeXusName[Monitor1]] = 'monitor_1'
     wf[NeXusName[snx.NXdetector]] = 'larmor_detector'
     da = wf.compute(DetectorData[SampleRun])
@@ -17,7 +17,12 @@ from ess.reduce.parameter import (
     parameter_registry,
 )
 from ess.reduce.ui import ResultBox, WorkflowWidget, workflow_widget
-from ess.reduce.widgets import OptionalWidget, SwitchWidget, create_parameter_widget
+from ess.reduce.widgets import (
+    BoundsWidget,
+    OptionalWidget,
+    SwitchWidget,
+    create_parameter_widget,
+)
 from ess.reduce.workflow import register_workflow, workflow_registry
 
 SwitchableInt = NewType('SwitchableInt', int)
@@ -249,6 +254,17 @@ def test_register_workflow() -> None:
     assert dummy_workflow_constructor not in workflow_registry
 
 
+def test_workflow_registry_discard_ignores_other_workflow_with_same_name() -> None:
+    def other_constructor() -> sl.Pipeline:
+        return sl.Pipeline([provider_with_switch])
+
+    other_constructor.__qualname__ = dummy_workflow_constructor.__qualname__
+    with temporary_workflow_registry(dummy_workflow_constructor):
+        workflow_registry.discard(other_constructor)
+        assert other_constructor not in workflow_registry
+        assert dummy_workflow_constructor in workflow_registry
+
+
 def _get_selection_widget(widget):
     return widget.children[0].children[0]
 
@@ -411,6 +427,25 @@ def test_bin_edges_widget_with_default_values() -> None:
     assert param_widget.fields['spacing'].value == 'linear'
 
 
+def test_bin_edges_widget_set_fields_warns_once_for_invalid_fields() -> None:
+    widget = _ready_widget(providers=[q_bins_print_provider], output_selections=[str])
+    param_widget = _get_param_widget(widget, QBins)
+    with pytest.warns(UserWarning, match=r"Cannot set fields \['bar', 'foo'\]") as w:
+        param_widget.set_fields({'start': 0.1, 'foo': 1, 'bar': 2})
+    assert len(w) == 1
+    assert param_widget.fields['start'].value == 0.1
+
+
+def test_bounds_widget_value() -> None:
+    widget = BoundsWidget()
+    widget.fields['start'].value = 1.0
+    widget.fields['end'].value = 2.5
+    widget.fields['unit'].value = 'm'
+    start, end = widget.value
+    assert sc.identical(start, sc.scalar(1.0, unit='m'))
+    assert sc.identical(end, sc.scalar(2.5, unit='m'))
+
+
 @pytest.mark.parametrize(
     'output',
     [